@@ -293,6 +293,8 @@ class NamedTupleCursor(_cursor):
         >>> rec.data
         "abc'def"
     """
+    # No __iter__ here: the base class iterates in batches of itersize using
+    # fetchmany(), which already returns records.
     Record = None
 
     def execute(self, query, vars=None):
@@ -329,27 +331,6 @@ class NamedTupleCursor(_cursor):
             nt = self.Record = self._make_nt()
         return [nt._make(x) for x in ts]
 
-    def __iter__(self):
-        it = super(NamedTupleCursor, self).__iter__()
-        try:
-            t = six.next(it)
-        except StopIteration:
-            return
-
-        nt = self.Record
-        if nt is None:
-            nt = self.Record = self._make_nt()
-
-        yield nt._make(t)
-
-        while 1:
-            try:
-                t = six.next(it)
-            except StopIteration:
-                return
-            else:
-                yield nt._make(t)
-
     try:
         from collections import namedtuple
     except ImportError as _exc:
@@ -86,16 +86,16 @@ class AsyncTests(ConnectingTestCase):
         cur = self.conn.cursor()
         sync_cur = self.sync_conn.cursor()
 
-        self.assert_(self.conn.async_)
-        self.assert_(not self.sync_conn.async_)
+        self.assertTrue(self.conn.async_)
+        self.assertTrue(not self.sync_conn.async_)
 
         # the async connection should be in isolevel 0
-        self.assertEquals(self.conn.isolation_level, 0)
+        self.assertEqual(self.conn.isolation_level, 0)
 
         # check other properties to be found on the connection
-        self.assert_(self.conn.server_version)
-        self.assert_(self.conn.protocol_version in (2,3))
-        self.assert_(self.conn.encoding in psycopg2.extensions.encodings)
+        self.assertTrue(self.conn.server_version)
+        self.assertTrue(self.conn.protocol_version in (2,3))
+        self.assertTrue(self.conn.encoding in psycopg2.extensions.encodings)
 
     def test_async_named_cursor(self):
         self.assertRaises(psycopg2.ProgrammingError,
@@ -110,7 +110,7 @@ class AsyncTests(ConnectingTestCase):
         self.wait(cur)
 
         self.assertFalse(self.conn.isexecuting())
-        self.assertEquals(cur.fetchone()[0], "a")
+        self.assertEqual(cur.fetchone()[0], "a")
 
     @skip_before_postgres(8, 2)
     def test_async_callproc(self):
@@ -120,7 +120,7 @@ class AsyncTests(ConnectingTestCase):
 
         self.wait(cur)
         self.assertFalse(self.conn.isexecuting())
-        self.assertEquals(cur.fetchall()[0][0], '')
+        self.assertEqual(cur.fetchall()[0][0], '')
 
     def test_async_after_async(self):
         cur = self.conn.cursor()
@@ -139,7 +139,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("select * from table1")
         self.wait(cur)
 
-        self.assertEquals(cur.fetchall()[0][0], 1)
+        self.assertEqual(cur.fetchall()[0][0], 1)
 
         cur.execute("delete from table1")
         self.wait(cur)
@@ -147,7 +147,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("select * from table1")
         self.wait(cur)
 
-        self.assertEquals(cur.fetchone(), None)
+        self.assertEqual(cur.fetchone(), None)
 
     def test_fetch_after_async(self):
         cur = self.conn.cursor()
@@ -158,7 +158,7 @@ class AsyncTests(ConnectingTestCase):
                           cur.fetchall)
         # but after waiting it should work
         self.wait(cur)
-        self.assertEquals(cur.fetchall()[0][0], "a")
+        self.assertEqual(cur.fetchall()[0][0], "a")
 
     def test_rollback_while_async(self):
         cur = self.conn.cursor()
@@ -187,14 +187,14 @@ class AsyncTests(ConnectingTestCase):
 
         cur.execute("select * from table1")
         self.wait(cur)
-        self.assertEquals(cur.fetchall()[0][0], 1)
+        self.assertEqual(cur.fetchall()[0][0], 1)
 
         cur.execute("delete from table1")
         self.wait(cur)
 
         cur.execute("select * from table1")
         self.wait(cur)
-        self.assertEquals(cur.fetchone(), None)
+        self.assertEqual(cur.fetchone(), None)
 
     def test_set_parameters_while_async(self):
         cur = self.conn.cursor()
@@ -203,7 +203,7 @@ class AsyncTests(ConnectingTestCase):
         self.assertTrue(self.conn.isexecuting())
 
         # getting transaction status works
-        self.assertEquals(self.conn.get_transaction_status(),
+        self.assertEqual(self.conn.get_transaction_status(),
                           extensions.TRANSACTION_STATUS_ACTIVE)
         self.assertTrue(self.conn.isexecuting())
 
@@ -241,7 +241,7 @@ class AsyncTests(ConnectingTestCase):
 
         # but after it's done it should work
         self.wait(cur)
-        self.assertEquals(list(cur), [(1, ), (2, ), (3, )])
+        self.assertEqual(list(cur), [(1, ), (2, ), (3, )])
         self.assertFalse(self.conn.isexecuting())
 
     def test_copy_while_async(self):
@@ -281,7 +281,7 @@ class AsyncTests(ConnectingTestCase):
         # but after it's done it should work
         self.wait(cur)
         cur.scroll(1)
-        self.assertEquals(cur.fetchall(), [(2, ), (3, )])
+        self.assertEqual(cur.fetchall(), [(2, ), (3, )])
 
         cur = self.conn.cursor()
         cur.execute("select id from table1 order by id")
@@ -297,7 +297,7 @@ class AsyncTests(ConnectingTestCase):
         self.wait(cur)
         cur.scroll(2)
         cur.scroll(-1)
-        self.assertEquals(cur.fetchall(), [(2, ), (3, )])
+        self.assertEqual(cur.fetchall(), [(2, ), (3, )])
 
     def test_scroll(self):
         cur = self.sync_conn.cursor()
@@ -310,7 +310,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("select id from table1 order by id")
         cur.scroll(2)
         cur.scroll(-1)
-        self.assertEquals(cur.fetchall(), [(2, ), (3, )])
+        self.assertEqual(cur.fetchall(), [(2, ), (3, )])
 
     def test_async_dont_read_all(self):
         cur = self.conn.cursor()
@@ -320,7 +320,7 @@ class AsyncTests(ConnectingTestCase):
         self.wait(cur)
 
         # it should be the result of the second query
-        self.assertEquals(cur.fetchone()[0], "b" * 10000)
+        self.assertEqual(cur.fetchone()[0], "b" * 10000)
 
     def test_async_subclass(self):
         class MyConn(psycopg2.extensions.connection):
@@ -328,8 +328,8 @@ class AsyncTests(ConnectingTestCase):
                 psycopg2.extensions.connection.__init__(self, dsn, async_=async_)
 
         conn = self.connect(connection_factory=MyConn, async_=True)
-        self.assert_(isinstance(conn, MyConn))
-        self.assert_(conn.async_)
+        self.assertTrue(isinstance(conn, MyConn))
+        self.assertTrue(conn.async_)
         conn.close()
 
     def test_flush_on_write(self):
@@ -356,7 +356,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("select 1")
         # polling with a sync query works
         cur.connection.poll()
-        self.assertEquals(cur.fetchone()[0], 1)
+        self.assertEqual(cur.fetchone()[0], 1)
 
     def test_notify(self):
         cur = self.conn.cursor()
@@ -367,7 +367,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("notify test_notify")
         self.wait(cur)
 
-        self.assertEquals(self.sync_conn.notifies, [])
+        self.assertEqual(self.sync_conn.notifies, [])
 
         pid = self.conn.get_backend_pid()
         for _ in range(5):
@@ -375,8 +375,8 @@ class AsyncTests(ConnectingTestCase):
             if not self.sync_conn.notifies:
                 time.sleep(0.5)
                 continue
-            self.assertEquals(len(self.sync_conn.notifies), 1)
-            self.assertEquals(self.sync_conn.notifies.pop(),
+            self.assertEqual(len(self.sync_conn.notifies), 1)
+            self.assertEqual(self.sync_conn.notifies.pop(),
                               (pid, "test_notify"))
             return
         self.fail("No NOTIFY in 2.5 seconds")
@@ -391,7 +391,7 @@ class AsyncTests(ConnectingTestCase):
         # fetching from a cursor with no results is an error
         self.assertRaises(psycopg2.ProgrammingError, cur2.fetchone)
         # fetching from the correct cursor works
-        self.assertEquals(cur1.fetchone()[0], 1)
+        self.assertEqual(cur1.fetchone()[0], 1)
 
     def test_error(self):
         cur = self.conn.cursor()
@@ -412,7 +412,7 @@ class AsyncTests(ConnectingTestCase):
         self.wait(cur)
         cur.execute("select * from table1 order by id")
         self.wait(cur)
-        self.assertEquals(cur.fetchall(), [(1, ), (2, ), (3, )])
+        self.assertEqual(cur.fetchall(), [(1, ), (2, ), (3, )])
         cur.execute("delete from table1")
         self.wait(cur)
 
@@ -423,7 +423,7 @@ class AsyncTests(ConnectingTestCase):
         self.assertRaises(psycopg2.ProgrammingError, self.wait, cur)
         cur2.execute("select 1")
         self.wait(cur2)
-        self.assertEquals(cur2.fetchone()[0], 1)
+        self.assertEqual(cur2.fetchone()[0], 1)
 
     def test_notices(self):
         del self.conn.notices[:]
@@ -434,7 +434,7 @@ class AsyncTests(ConnectingTestCase):
         cur.execute("create temp table chatty (id serial primary key);")
         self.wait(cur)
         self.assertEqual("CREATE TABLE", cur.statusmessage)
-        self.assert_(self.conn.notices)
+        self.assertTrue(self.conn.notices)
 
     def test_async_cursor_gone(self):
         import gc
@@ -13,11 +13,16 @@ from psycopg2cffi.tests.psycopg2_tests.testutils import unittest
 
 class Pep479Tests(unittest.TestCase):
 
-    def setUp(self):
-        self.conn = psycopg2.connect(dsn)
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = psycopg2.connect(dsn)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
 
     def tearDown(self):
-        self.conn.close()
+        self.conn.rollback()
 
     def test(self):
         curs = self.conn.cursor(cursor_factory=psycopg2.extras.NamedTupleCursor)
@@ -51,7 +51,7 @@ class ConnectionTests(ConnectingTestCase):
         conn = self.conn
         conn.close()
         conn.close()
-        self.assert_(conn.closed)
+        self.assertTrue(conn.closed)
 
     def test_cursor_closed_attribute(self):
         conn = self.conn
@@ -103,7 +103,7 @@ class ConnectionTests(ConnectingTestCase):
             cur.execute("set client_min_messages=debug1")
         cur.execute("create temp table chatty (id serial primary key);")
         self.assertEqual("CREATE TABLE", cur.statusmessage)
-        self.assert_(conn.notices)
+        self.assertTrue(conn.notices)
 
     def test_notices_utf8(self):
         conn = self.conn
@@ -112,8 +112,8 @@ class ConnectionTests(ConnectingTestCase):
             cur.execute("set client_min_messages=debug1")
         cur.execute(_u(b("create temp table мыыchatty (id serial primary key);")))
         self.assertEqual("CREATE TABLE", cur.statusmessage)
-        self.assert_(conn.notices)
-        self.assert_(_u(b('мыыchatty')) in conn.notices[0])
+        self.assertTrue(conn.notices)
+        self.assertTrue(_u(b('мыыchatty')) in conn.notices[0])
 
     def test_notices_consistent_order(self):
         conn = self.conn
@@ -123,10 +123,10 @@ class ConnectionTests(ConnectingTestCase):
         cur.execute("create temp table table1 (id serial); create temp table table2 (id serial);")
         cur.execute("create temp table table3 (id serial); create temp table table4 (id serial);")
         self.assertEqual(4, len(conn.notices))
-        self.assert_('table1' in conn.notices[0])
-        self.assert_('table2' in conn.notices[1])
-        self.assert_('table3' in conn.notices[2])
-        self.assert_('table4' in conn.notices[3])
+        self.assertTrue('table1' in conn.notices[0])
+        self.assertTrue('table2' in conn.notices[1])
+        self.assertTrue('table3' in conn.notices[2])
+        self.assertTrue('table4' in conn.notices[3])
 
     def test_notices_limited(self):
         conn = self.conn
@@ -138,13 +138,13 @@ class ConnectionTests(ConnectingTestCase):
             cur.execute(sql)
 
         self.assertEqual(50, len(conn.notices))
-        self.assert_('table99' in conn.notices[-1], conn.notices[-1])
+        self.assertTrue('table99' in conn.notices[-1], conn.notices[-1])
 
     def test_server_version(self):
-        self.assert_(self.conn.server_version)
+        self.assertTrue(self.conn.server_version)
 
     def test_protocol_version(self):
-        self.assert_(self.conn.protocol_version in (2,3),
+        self.assertTrue(self.conn.protocol_version in (2,3),
             self.conn.protocol_version)
 
     def test_tpc_unsupported(self):
@@ -171,7 +171,7 @@ class ConnectionTests(ConnectingTestCase):
         t2.start()
         t1.join()
         t2.join()
-        self.assert_(time.time() - t0 < 7,
+        self.assertTrue(time.time() - t0 < 7,
             "something broken in concurrency")
 
     def test_encoding_name(self):
@@ -188,7 +188,7 @@ class ConnectionTests(ConnectingTestCase):
         oldenc = os.environ.get('PGCLIENTENCODING')
         os.environ['PGCLIENTENCODING'] = 'utf-8'    # malformed spelling
         try:
-            self.conn = self.connect()
+            self.conn = self.connect(pooled=False)
         finally:
             if oldenc is not None:
                 os.environ['PGCLIENTENCODING'] = oldenc
@@ -203,7 +203,7 @@ class ConnectionTests(ConnectingTestCase):
         conn.close()
         del conn
         gc.collect()
-        self.assert_(w() is None)
+        self.assertTrue(w() is None)
 
     def test_commit_concurrency(self):
         # The problem is the one reported in ticket #103. Because of bad
@@ -232,7 +232,7 @@ class ConnectionTests(ConnectingTestCase):
         # Stop the committer thread
         stop.append(True)
 
-        self.assert_(not notices, "%d notices raised" % len(notices))
+        self.assertTrue(not notices, "%d notices raised" % len(notices))
 
     def test_connect_cursor_factory(self):
         from psycopg2cffi import extras
@@ -300,8 +300,8 @@ class CreateExceptionTestCase(ConnectingTestCase):
                 self.assertIsInstance(e, psycopg2.ProgrammingError)
                 self.assertIn(query, e.args[0])
             else:
-                self.assert_(isinstance(e, psycopg2.ProgrammingError))
-                self.assert_(query in e.args[0])
+                self.assertTrue(isinstance(e, psycopg2.ProgrammingError))
+                self.assertTrue(query in e.args[0])
         else:
             assert False, 'expected exception'
 
@@ -329,7 +329,7 @@ class IsolationLevelsTestCase(ConnectingTestCase):
 
     def test_encoding(self):
         conn = self.connect()
-        self.assert_(conn.encoding in extensions.encodings)
+        self.assertTrue(conn.encoding in extensions.encodings)
 
     def test_set_isolation_level(self):
         conn = self.connect()
@@ -1009,12 +1009,12 @@ class AutocommitTests(ConnectingTestCase):
         # to make it consistent with other methods; meanwhile let's just check
         # it doesn't explode.
         try:
-            self.assert_(self.conn.autocommit in (True, False))
+            self.assertTrue(self.conn.autocommit in (True, False))
         except psycopg2.InterfaceError:
             pass
 
     def test_default_no_autocommit(self):
-        self.assert_(not self.conn.autocommit)
+        self.assertTrue(not self.conn.autocommit)
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
             extensions.TRANSACTION_STATUS_IDLE)
@@ -1032,7 +1032,7 @@ class AutocommitTests(ConnectingTestCase):
 
     def test_set_autocommit(self):
         self.conn.autocommit = True
-        self.assert_(self.conn.autocommit)
+        self.assertTrue(self.conn.autocommit)
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
             extensions.TRANSACTION_STATUS_IDLE)
@@ -1044,7 +1044,7 @@ class AutocommitTests(ConnectingTestCase):
             extensions.TRANSACTION_STATUS_IDLE)
 
         self.conn.autocommit = False
-        self.assert_(not self.conn.autocommit)
+        self.assertTrue(not self.conn.autocommit)
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
             extensions.TRANSACTION_STATUS_IDLE)
@@ -1062,7 +1062,7 @@ class AutocommitTests(ConnectingTestCase):
 
     def test_set_session_autocommit(self):
         self.conn.set_session(autocommit=True)
-        self.assert_(self.conn.autocommit)
+        self.assertTrue(self.conn.autocommit)
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
             extensions.TRANSACTION_STATUS_IDLE)
@@ -1074,7 +1074,7 @@ class AutocommitTests(ConnectingTestCase):
             extensions.TRANSACTION_STATUS_IDLE)
 
         self.conn.set_session(autocommit=False)
-        self.assert_(not self.conn.autocommit)
+        self.assertTrue(not self.conn.autocommit)
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
             extensions.TRANSACTION_STATUS_IDLE)
@@ -1086,7 +1086,7 @@ class AutocommitTests(ConnectingTestCase):
         self.conn.rollback()
 
         self.conn.set_session('serializable', readonly=True, autocommit=True)
-        self.assert_(self.conn.autocommit)
+        self.assertTrue(self.conn.autocommit)
         cur.execute('select 1;')
         self.assertEqual(self.conn.status, extensions.STATUS_READY)
         self.assertEqual(self.conn.get_transaction_status(),
@@ -38,12 +38,12 @@ class ExtrasDictCursorTests(ConnectingTestCase):
         self.conn.close()
         self.conn = self.connect(connection_factory=psycopg2.extras.DictConnection)
         cur = self.conn.cursor()
-        self.assert_(isinstance(cur, psycopg2.extras.DictCursor))
+        self.assertTrue(isinstance(cur, psycopg2.extras.DictCursor))
         self.assertEqual(cur.name, None)
         # overridable
         cur = self.conn.cursor('foo', cursor_factory=psycopg2.extras.NamedTupleCursor)
         self.assertEqual(cur.name, 'foo')
-        self.assert_(isinstance(cur, psycopg2.extras.NamedTupleCursor))
+        self.assertTrue(isinstance(cur, psycopg2.extras.NamedTupleCursor))
 
     def testDictCursorWithPlainCursorFetchOne(self):
         self._testWithPlainCursor(lambda curs: curs.fetchone())
@@ -66,8 +66,8 @@ class ExtrasDictCursorTests(ConnectingTestCase):
     def testUpdateRow(self):
         row = self._testWithPlainCursor(lambda curs: curs.fetchone())
         row['foo'] = 'qux'
-        self.failUnless(row['foo'] == 'qux')
-        self.failUnless(row[0] == 'qux')
+        self.assertTrue(row['foo'] == 'qux')
+        self.assertTrue(row[0] == 'qux')
 
     @skip_before_postgres(8, 0)
     def testDictCursorWithPlainCursorIterRowNumber(self):
@@ -78,8 +78,8 @@ class ExtrasDictCursorTests(ConnectingTestCase):
         curs = self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
         curs.execute("SELECT * FROM ExtrasDictCursorTests")
         row = getter(curs)
-        self.failUnless(row['foo'] == 'bar')
-        self.failUnless(row[0] == 'bar')
+        self.assertTrue(row['foo'] == 'bar')
+        self.assertTrue(row[0] == 'bar')
         return row
 
 
@@ -110,7 +110,7 @@ class ExtrasDictCursorTests(ConnectingTestCase):
         curs = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
         curs.execute("SELECT * FROM ExtrasDictCursorTests")
         row = getter(curs)
-        self.failUnless(row['foo'] == 'bar')
+        self.assertTrue(row['foo'] == 'bar')
 
 
     def testDictCursorWithNamedCursorFetchOne(self):
@@ -145,8 +145,8 @@ class ExtrasDictCursorTests(ConnectingTestCase):
         curs = self.conn.cursor('aname', cursor_factory=psycopg2.extras.DictCursor)
         curs.execute("SELECT * FROM ExtrasDictCursorTests")
         row = getter(curs)
-        self.failUnless(row['foo'] == 'bar')
-        self.failUnless(row[0] == 'bar')
+        self.assertTrue(row['foo'] == 'bar')
+        self.assertTrue(row[0] == 'bar')
 
 
     def testDictCursorRealWithNamedCursorFetchOne(self):
@@ -181,7 +181,7 @@ class ExtrasDictCursorTests(ConnectingTestCase):
         curs = self.conn.cursor('aname', cursor_factory=extras.RealDictCursor)
         curs.execute("SELECT * FROM ExtrasDictCursorTests")
         row = getter(curs)
-        self.failUnless(row['foo'] == 'bar')
+        self.assertTrue(row['foo'] == 'bar')
 
 
     def _testNamedCursorNotGreedy(self, curs):
@@ -193,8 +193,8 @@ class ExtrasDictCursorTests(ConnectingTestCase):
             recs.append(t)
 
         # check that the dataset was not fetched in a single gulp
-        self.assert_(recs[1]['ts'] - recs[0]['ts'] < timedelta(seconds=0.005))
-        self.assert_(recs[2]['ts'] - recs[1]['ts'] > timedelta(seconds=0.0099))
+        self.assertTrue(recs[1]['ts'] - recs[0]['ts'] < timedelta(seconds=0.005))
+        self.assertTrue(recs[2]['ts'] - recs[1]['ts'] > timedelta(seconds=0.0099))
 
     def _testIterRowNumber(self, curs):
         # Only checking for dataset < itersize:
@@ -253,7 +253,7 @@ class NamedTupleCursorTest(ConnectingTestCase):
     def test_cursor_args(self):
         cur = self.conn.cursor('foo', cursor_factory=psycopg2.extras.DictCursor)
         self.assertEqual(cur.name, 'foo')
-        self.assert_(isinstance(cur, psycopg2.extras.DictCursor))
+        self.assertTrue(isinstance(cur, psycopg2.extras.DictCursor))
 
     @skip_if_no_namedtuple
     def test_fetchone(self):
@@ -346,6 +346,31 @@ class NamedTupleCursorTest(ConnectingTestCase):
         self.assertEqual(curs.rownumber, 3)
         self.assertEqual(curs.rowcount, 3)
 
+    @skip_if_no_namedtuple
+    def test_iter_itersize(self):
+        curs = self.conn.cursor()
+        curs.itersize = 2
+
+        # count the records built: each row should be converted only once
+        makes = []
+        make_nt = curs._make_nt
+
+        def counting_make_nt():
+            class Record(make_nt()):
+                @classmethod
+                def _make(cls, iterable):
+                    makes.append(None)
+                    return super(Record, cls)._make(iterable)
+            return Record
+
+        curs._make_nt = counting_make_nt
+
+        curs.execute("select * from nttest order by 1")
+        recs = list(curs)
+        self.assertEqual([(t.i, t.s) for t in recs],
+            [(1, 'foo'), (2, 'bar'), (3, 'baz')])
+        self.assertEqual(len(makes), 3)
+
     def test_error_message(self):
         try:
             from collections import namedtuple
@@ -463,8 +488,8 @@ class NamedTupleCursorTest(ConnectingTestCase):
             recs.append(t)
 
         # check that the dataset was not fetched in a single gulp
-        self.assert_(recs[1].ts - recs[0].ts < timedelta(seconds=0.005))
-        self.assert_(recs[2].ts - recs[1].ts > timedelta(seconds=0.0099))
+        self.assertTrue(recs[1].ts - recs[0].ts < timedelta(seconds=0.005))
+        self.assertTrue(recs[2].ts - recs[1].ts > timedelta(seconds=0.0099))
 
     @skip_if_no_namedtuple
     @skip_before_postgres(8, 0)
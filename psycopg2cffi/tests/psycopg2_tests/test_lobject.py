@@ -57,10 +57,7 @@ class LargeObjectTestCase(ConnectingTestCase):
         if self.tmpdir:
             shutil.rmtree(self.tmpdir, ignore_errors=True)
 
-        if self.conn.closed:
-            return
-
-        if self.lo_oid is not None:
+        if not self.conn.closed and self.lo_oid is not None:
             self.conn.rollback()
             try:
                 lo = self.conn.lobject(self.lo_oid, "n")
@@ -197,7 +194,7 @@ class LargeObjectTests(LargeObjectTestCase):
         self.assertEqual(lo.read(4), "some")
         data1 = lo.read()
         # avoid dumping megacraps in the console in case of error
-        self.assert_(data == data1,
+        self.assertTrue(data == data1,
             "%r... != %r..." % (data[:100], data1[:100]))
 
     def test_seek_tell(self):
@@ -228,7 +225,7 @@ class LargeObjectTests(LargeObjectTestCase):
         # the object doesn't exist now, so we can't reopen it.
         self.assertRaises(psycopg2.OperationalError, self.conn.lobject, lo.oid)
         # And the object has been closed.
-        self.assertEquals(lo.closed, True)
+        self.assertEqual(lo.closed, True)
 
     def test_export(self):
         lo = self.conn.lobject()
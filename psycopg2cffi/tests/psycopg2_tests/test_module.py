@@ -73,10 +73,10 @@ class ConnectTestCase(unittest.TestCase):
 
         psycopg2.connect(database='foo',
             user='postgres', password='secret', port=5432)
-        self.assert_('dbname=foo' in self.args[0])
-        self.assert_('user=postgres' in self.args[0])
-        self.assert_('password=secret' in self.args[0])
-        self.assert_('port=5432' in self.args[0])
+        self.assertTrue('dbname=foo' in self.args[0])
+        self.assertTrue('user=postgres' in self.args[0])
+        self.assertTrue('password=secret' in self.args[0])
+        self.assertTrue('port=5432' in self.args[0])
         self.assertEqual(len(self.args[0].split()), 4)
 
     def test_generic_keywords(self):
@@ -101,12 +101,12 @@ class ConnectTestCase(unittest.TestCase):
         psycopg2.connect(database='foo', bar='baz', async_=1)
         self.assertEqual(self.args[0], 'dbname=foo bar=baz')
         self.assertEqual(self.args[1], None)
-        self.assert_(self.args[2])
+        self.assertTrue(self.args[2])
 
         psycopg2.connect("dbname=foo bar=baz", async_=True)
         self.assertEqual(self.args[0], 'dbname=foo bar=baz')
         self.assertEqual(self.args[1], None)
-        self.assert_(self.args[2])
+        self.assertTrue(self.args[2])
 
     def test_empty_param(self):
         psycopg2.connect(database='sony', password='')
@@ -146,8 +146,8 @@ class ExceptionsTestCase(ConnectingTestCase):
             e = exc
 
         self.assertEqual(e.pgcode, '42P01')
-        self.assert_(e.pgerror)
-        self.assert_(e.cursor is cur)
+        self.assertTrue(e.pgerror)
+        self.assertTrue(e.cursor is cur)
 
     def test_diagnostics_attributes(self):
         cur = self.conn.cursor()
@@ -157,7 +157,7 @@ class ExceptionsTestCase(ConnectingTestCase):
             e = exc
 
         diag = e.diag
-        self.assert_(isinstance(diag, psycopg2.extensions.Diagnostics))
+        self.assertTrue(isinstance(diag, psycopg2.extensions.Diagnostics))
         for attr in [
                 'column_name', 'constraint_name', 'context', 'datatype_name',
                 'internal_position', 'internal_query', 'message_detail',
@@ -166,7 +166,7 @@ class ExceptionsTestCase(ConnectingTestCase):
                 'statement_position', 'table_name', ]:
             v = getattr(diag, attr)
             if v is not None:
-                self.assert_(isinstance(v, str))
+                self.assertTrue(isinstance(v, str))
 
     def test_diagnostics_values(self):
         cur = self.conn.cursor()
@@ -278,7 +278,7 @@ class ExceptionsTestCase(ConnectingTestCase):
 
         self.assertEqual(e.pgerror, e1.pgerror)
         self.assertEqual(e.pgcode, e1.pgcode)
-        self.assert_(e1.cursor is None)
+        self.assertTrue(e1.cursor is None)
 
 
 def test_suite():
@@ -27,8 +27,7 @@ from psycopg2cffi.tests.psycopg2_tests.testutils import unittest
 import psycopg2cffi as psycopg2
 from psycopg2cffi import extensions
 from psycopg2cffi.tests.psycopg2_tests.testconfig import dsn
-from psycopg2cffi.tests.psycopg2_tests.testutils import script_to_py3, \
-        ConnectingTestCase
+from psycopg2cffi.tests.psycopg2_tests.testutils import ConnectingTestCase
 
 import sys
 import time
@@ -62,7 +61,7 @@ import %(module)s as psycopg2
 import %(module)s.extensions as ext
 conn = psycopg2.connect(%(dsn)r)
 conn.set_isolation_level(ext.ISOLATION_LEVEL_AUTOCOMMIT)
-print conn.get_backend_pid()
+print(conn.get_backend_pid())
 curs = conn.cursor()
 curs.execute("NOTIFY " %(name)r %(payload)r)
 curs.close()
@@ -71,7 +70,7 @@ conn.close()
         'module': psycopg2.__name__,
         'dsn': dsn, 'sec': sec, 'name': name, 'payload': payload})
 
-        return Popen([sys.executable, '-c', script_to_py3(script)], stdout=PIPE)
+        return Popen([sys.executable, '-c', script], stdout=PIPE)
 
     def test_notifies_received_on_poll(self):
         self.autocommit(self.conn)
@@ -82,7 +81,7 @@ conn.close()
         t0 = time.time()
         ready = select.select([self.conn], [], [], 5)
         t1 = time.time()
-        self.assert_(0.99 < t1 - t0 < 4, t1 - t0)
+        self.assertTrue(0.99 < t1 - t0 < 4, t1 - t0)
 
         pid = int(proc.communicate()[0])
         self.assertEqual(0, len(self.conn.notifies))
@@ -127,7 +126,7 @@ conn.close()
         time.sleep(0.5)
         self.conn.poll()
         notify = self.conn.notifies[0]
-        self.assert_(isinstance(notify, extensions.Notify))
+        self.assertTrue(isinstance(notify, extensions.Notify))
 
     def test_notify_attributes(self):
         self.autocommit(self.conn)
@@ -61,7 +61,7 @@ class QuotingTestCase(ConnectingTestCase):
         res = curs.fetchone()[0]
 
         self.assertEqual(res, data)
-        self.assert_(not self.conn.notices)
+        self.assertTrue(not self.conn.notices)
 
     def test_binary(self):
         data = b"""some data with \000\013 binary
@@ -84,7 +84,7 @@ class QuotingTestCase(ConnectingTestCase):
                 "bytea broken with server >= 9.0, libpq < 9")
 
         self.assertEqual(res, data)
-        self.assert_(not self.conn.notices)
+        self.assertTrue(not self.conn.notices)
 
     def test_unicode(self):
         curs = self.conn.cursor()
@@ -108,7 +108,7 @@ class QuotingTestCase(ConnectingTestCase):
         res = curs.fetchone()[0]
 
         self.assertEqual(res, data)
-        self.assert_(not self.conn.notices)
+        self.assertTrue(not self.conn.notices)
 
     def test_latin1(self):
         self.conn.set_client_encoding('LATIN1')
@@ -123,7 +123,7 @@ class QuotingTestCase(ConnectingTestCase):
         curs.execute("SELECT %s::text;", (data,))
         res = curs.fetchone()[0]
         self.assertEqual(res, data)
-        self.assert_(not self.conn.notices)
+        self.assertTrue(not self.conn.notices)
 
         # as unicode
         if sys.version_info[0] < 3:
@@ -133,7 +133,7 @@ class QuotingTestCase(ConnectingTestCase):
             curs.execute("SELECT %s::text;", (data,))
             res = curs.fetchone()[0]
             self.assertEqual(res, data)
-            self.assert_(not self.conn.notices)
+            self.assertTrue(not self.conn.notices)
 
     def test_koi8(self):
         self.conn.set_client_encoding('KOI8')
@@ -148,7 +148,7 @@ class QuotingTestCase(ConnectingTestCase):
         curs.execute("SELECT %s::text;", (data,))
         res = curs.fetchone()[0]
         self.assertEqual(res, data)
-        self.assert_(not self.conn.notices)
+        self.assertTrue(not self.conn.notices)
 
         # as unicode
         if sys.version_info[0] < 3:
@@ -158,7 +158,7 @@ class QuotingTestCase(ConnectingTestCase):
             curs.execute("SELECT %s::text;", (data,))
             res = curs.fetchone()[0]
             self.assertEqual(res, data)
-            self.assert_(not self.conn.notices)
+            self.assertTrue(not self.conn.notices)
 
 
 class TestQuotedString(ConnectingTestCase):
@@ -49,10 +49,10 @@ class TypesExtrasTests(ConnectingTestCase):
         extras.register_uuid()
         u = uuid.UUID('9c6d5a77-7256-457e-9461-347b4358e350')
         s = self.execute("SELECT %s AS foo", (u,))
-        self.failUnless(u == s)
+        self.assertTrue(u == s)
         # must survive NULL cast to a uuid
         s = self.execute("SELECT NULL::uuid AS foo")
-        self.failUnless(s is None)
+        self.assertTrue(s is None)
 
     @skip_if_no_uuid
     def testUUIDARRAY(self):
@@ -60,35 +60,35 @@ class TypesExtrasTests(ConnectingTestCase):
         extras.register_uuid()
         u = [uuid.UUID('9c6d5a77-7256-457e-9461-347b4358e350'), uuid.UUID('9c6d5a77-7256-457e-9461-347b4358e352')]
         s = self.execute("SELECT %s AS foo", (u,))
-        self.failUnless(u == s)
+        self.assertTrue(u == s)
         # array with a NULL element
         u = [uuid.UUID('9c6d5a77-7256-457e-9461-347b4358e350'), None]
         s = self.execute("SELECT %s AS foo", (u,))
-        self.failUnless(u == s)
+        self.assertTrue(u == s)
         # must survive NULL cast to a uuid[]
         s = self.execute("SELECT NULL::uuid[] AS foo")
-        self.failUnless(s is None)
+        self.assertTrue(s is None)
         # what about empty arrays?
         s = self.execute("SELECT '{}'::uuid[] AS foo")
-        self.failUnless(type(s) == list and len(s) == 0)
+        self.assertTrue(type(s) == list and len(s) == 0)
 
     def testINET(self):
         extras.register_inet()
         i = extras.Inet("192.168.1.0/24")
         s = self.execute("SELECT %s AS foo", (i,))
-        self.failUnless(i.addr == s.addr)
+        self.assertTrue(i.addr == s.addr)
         # must survive NULL cast to inet
         s = self.execute("SELECT NULL::inet AS foo")
-        self.failUnless(s is None)
+        self.assertTrue(s is None)
 
     def testINETARRAY(self):
         extras.register_inet()
         i = extras.Inet("192.168.1.0/24")
         s = self.execute("SELECT %s AS foo", ([i],))
-        self.failUnless(i.addr == s[0].addr)
+        self.assertTrue(i.addr == s[0].addr)
         # must survive NULL cast to inet
         s = self.execute("SELECT NULL::inet[] AS foo")
-        self.failUnless(s is None)
+        self.assertTrue(s is None)
 
     def test_inet_conform(self):
         from psycopg2cffi.extras import Inet
@@ -114,7 +114,7 @@ class TypesExtrasTests(ConnectingTestCase):
         try:
             extensions.adapt(Foo(), extensions.ISQLQuote, None)
         except psycopg2.ProgrammingError as err:
-            self.failUnless(str(err) == "can't adapt type 'Foo'")
+            self.assertTrue(str(err) == "can't adapt type 'Foo'")
 
 
 def skip_if_no_hstore(f):
@@ -143,7 +143,7 @@ class HstoreTestCase(ConnectingTestCase):
         a.prepare(self.conn)
         q = a.getquoted()
 
-        self.assert_(q.startswith(b"(("), q)
+        self.assertTrue(q.startswith(b"(("), q)
         ii = q[1:-1].split(b"||")
         ii.sort()
 
@@ -171,7 +171,7 @@ class HstoreTestCase(ConnectingTestCase):
         q = a.getquoted()
 
         m = re.match(br'hstore\(ARRAY\[([^\]]+)\], ARRAY\[([^\]]+)\]\)', q)
-        self.assert_(m, repr(q))
+        self.assertTrue(m, repr(q))
 
         kk = m.group(1).split(b", ")
         vv = m.group(2).split(b", ")
@@ -227,7 +227,7 @@ class HstoreTestCase(ConnectingTestCase):
         cur = self.conn.cursor()
         cur.execute("select null::hstore, ''::hstore, 'a => b'::hstore")
         t = cur.fetchone()
-        self.assert_(t[0] is None)
+        self.assertTrue(t[0] is None)
         self.assertEqual(t[1], {})
         self.assertEqual(t[2], {'a': 'b'})
 
@@ -239,7 +239,7 @@ class HstoreTestCase(ConnectingTestCase):
         register_hstore(cur)
         cur.execute("select null::hstore, ''::hstore, 'a => b'::hstore")
         t = cur.fetchone()
-        self.assert_(t[0] is None)
+        self.assertTrue(t[0] is None)
         self.assertEqual(t[1], {})
         self.assertEqual(t[2], {'a': 'b'})
 
@@ -251,11 +251,11 @@ class HstoreTestCase(ConnectingTestCase):
         cur = self.conn.cursor()
         cur.execute("select null::hstore, ''::hstore, 'a => b'::hstore")
         t = cur.fetchone()
-        self.assert_(t[0] is None)
+        self.assertTrue(t[0] is None)
         self.assertEqual(t[1], {})
         self.assertEqual(t[2], {_u(b'a'): _u(b'b')})
-        self.assert_(isinstance(list(t[2].keys())[0], six.text_type))
-        self.assert_(isinstance(list(t[2].values())[0], six.text_type))
+        self.assertTrue(isinstance(list(t[2].keys())[0], six.text_type))
+        self.assertTrue(isinstance(list(t[2].values())[0], six.text_type))
 
     @skip_if_no_hstore
     def test_register_globally(self):
@@ -269,7 +269,7 @@ class HstoreTestCase(ConnectingTestCase):
                 cur2 = self.conn.cursor()
                 cur2.execute("select 'a => b'::hstore")
                 r = cur2.fetchone()
-                self.assert_(isinstance(r[0], dict))
+                self.assertTrue(isinstance(r[0], dict))
             finally:
                 conn2.close()
         finally:
@@ -279,7 +279,7 @@ class HstoreTestCase(ConnectingTestCase):
         cur = self.conn.cursor()
         cur.execute("select 'a => b'::hstore")
         r = cur.fetchone()
-        self.assert_(isinstance(r[0], str))
+        self.assertTrue(isinstance(r[0], str))
 
     @skip_if_no_hstore
     def test_roundtrip(self):
@@ -292,7 +292,7 @@ class HstoreTestCase(ConnectingTestCase):
             d1 = cur.fetchone()[0]
             self.assertEqual(len(d), len(d1))
             for k in d:
-                self.assert_(k in d1, k)
+                self.assertTrue(k in d1, k)
                 self.assertEqual(d[k], d1[k])
 
         ok({})
@@ -322,10 +322,10 @@ class HstoreTestCase(ConnectingTestCase):
             d1 = cur.fetchone()[0]
             self.assertEqual(len(d), len(d1))
             for k, v in d1.items():
-                self.assert_(k in d, k)
+                self.assertTrue(k in d, k)
                 self.assertEqual(d[k], v)
-                self.assert_(isinstance(k, six.text_type))
-                self.assert_(v is None or isinstance(v, six.text_type))
+                self.assertTrue(isinstance(k, six.text_type))
+                self.assertTrue(v is None or isinstance(v, six.text_type))
 
         ok({})
         ok({'a': 'b', 'c': None, 'd': _u(b'\xe2\x82\xac'), _u(b'\xe2\x98\x83'): 'e'})
@@ -347,7 +347,7 @@ class HstoreTestCase(ConnectingTestCase):
         try:
             cur.execute("select null::hstore, ''::hstore, 'a => b'::hstore")
             t = cur.fetchone()
-            self.assert_(t[0] is None)
+            self.assertTrue(t[0] is None)
             self.assertEqual(t[1], {})
             self.assertEqual(t[2], {'a': 'b'})
 
@@ -403,7 +403,7 @@ class HstoreTestCase(ConnectingTestCase):
         try:
             cur.execute("select null::hstore, ''::hstore, 'a => b'::hstore, '{a=>b}'::hstore[]")
             t = cur.fetchone()
-            self.assert_(t[0] is None)
+            self.assertTrue(t[0] is None)
             self.assertEqual(t[1], {})
             self.assertEqual(t[2], {'a': 'b'})
             self.assertEqual(t[3], [{'a': 'b'}])
@@ -532,7 +532,7 @@ class AdaptTypeTestCase(ConnectingTestCase):
         self.assertEqual(t.name, 'type_isd')
         self.assertEqual(t.schema, 'public')
         self.assertEqual(t.oid, oid)
-        self.assert_(issubclass(t.type, tuple))
+        self.assertTrue(issubclass(t.type, tuple))
         self.assertEqual(t.attnames, ['anint', 'astring', 'adate'])
         self.assertEqual(t.atttypes, [23,25,1082])
 
@@ -540,7 +540,7 @@ class AdaptTypeTestCase(ConnectingTestCase):
         r = (10, 'hello', date(2011,1,2))
         curs.execute("select %s::type_isd;", (r,))
         v = curs.fetchone()[0]
-        self.assert_(isinstance(v, t.type))
+        self.assertTrue(isinstance(v, t.type))
         self.assertEqual(v[0], 10)
         self.assertEqual(v[1], "hello")
         self.assertEqual(v[2], date(2011,1,2))
@@ -550,7 +550,7 @@ class AdaptTypeTestCase(ConnectingTestCase):
         except ImportError:
             pass
         else:
-            self.assert_(t.type is not tuple)
+            self.assertTrue(t.type is not tuple)
             self.assertEqual(v.anint, 10)
             self.assertEqual(v.astring, "hello")
             self.assertEqual(v.adate, date(2011,1,2))
@@ -692,11 +692,11 @@ class AdaptTypeTestCase(ConnectingTestCase):
         curs.execute("select %s::type_isd[];", ([r1, r2],))
         v = curs.fetchone()[0]
         self.assertEqual(len(v), 2)
-        self.assert_(isinstance(v[0], t.type))
+        self.assertTrue(isinstance(v[0], t.type))
         self.assertEqual(v[0][0], 10)
         self.assertEqual(v[0][1], "hello")
         self.assertEqual(v[0][2], date(2011,1,2))
-        self.assert_(isinstance(v[1], t.type))
+        self.assertTrue(isinstance(v[1], t.type))
         self.assertEqual(v[1][0], 20)
         self.assertEqual(v[1][1], "world")
         self.assertEqual(v[1][2], date(2011,1,3))
@@ -800,7 +800,7 @@ class AdaptTypeTestCase(ConnectingTestCase):
         r = (10, 'hello', date(2011,1,2))
         curs.execute("select %s::type_isd;", (r,))
         v = curs.fetchone()[0]
-        self.assert_(isinstance(v, dict))
+        self.assertTrue(isinstance(v, dict))
         self.assertEqual(v['anint'], 10)
         self.assertEqual(v['astring'], "hello")
         self.assertEqual(v['adate'], date(2011,1,2))
@@ -1004,7 +1004,7 @@ class JsonTestCase(ConnectingTestCase):
         curs = self.conn.cursor()
         curs.execute("""select '{"a": 100.0, "b": null}'::json""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data['a'], Decimal))
+        self.assertTrue(isinstance(data['a'], Decimal))
         self.assertEqual(data['a'], Decimal('100.0'))
 
     @skip_if_no_json_module
@@ -1022,7 +1022,7 @@ class JsonTestCase(ConnectingTestCase):
             curs = self.conn.cursor()
             curs.execute("""select '{"a": 100.0, "b": null}'::json""")
             data = curs.fetchone()[0]
-            self.assert_(isinstance(data['a'], Decimal))
+            self.assertTrue(isinstance(data['a'], Decimal))
             self.assertEqual(data['a'], Decimal('100.0'))
         finally:
             extensions.string_types.pop(new.values[0])
@@ -1042,12 +1042,12 @@ class JsonTestCase(ConnectingTestCase):
 
         curs.execute("""select '{"a": 100.0, "b": null}'::json""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data['a'], Decimal))
+        self.assertTrue(isinstance(data['a'], Decimal))
         self.assertEqual(data['a'], Decimal('100.0'))
 
         curs.execute("""select array['{"a": 100.0, "b": null}']::json[]""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data[0]['a'], Decimal))
+        self.assertTrue(isinstance(data[0]['a'], Decimal))
         self.assertEqual(data[0]['a'], Decimal('100.0'))
 
     @skip_if_no_json_module
@@ -1129,12 +1129,12 @@ class JsonbTestCase(ConnectingTestCase):
         curs = self.conn.cursor()
         curs.execute("""select '{"a": 100.0, "b": null}'::jsonb""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data['a'], Decimal))
+        self.assertTrue(isinstance(data['a'], Decimal))
         self.assertEqual(data['a'], Decimal('100.0'))
         # sure we are not manling json too?
         curs.execute("""select '{"a": 100.0, "b": null}'::json""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data['a'], float))
+        self.assertTrue(isinstance(data['a'], float))
         self.assertEqual(data['a'], 100.0)
 
     def test_register_default(self):
@@ -1145,12 +1145,12 @@ class JsonbTestCase(ConnectingTestCase):
 
         curs.execute("""select '{"a": 100.0, "b": null}'::jsonb""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data['a'], Decimal))
+        self.assertTrue(isinstance(data['a'], Decimal))
         self.assertEqual(data['a'], Decimal('100.0'))
 
         curs.execute("""select array['{"a": 100.0, "b": null}']::jsonb[]""")
         data = curs.fetchone()[0]
-        self.assert_(isinstance(data[0]['a'], Decimal))
+        self.assertTrue(isinstance(data[0]['a'], Decimal))
         self.assertEqual(data[0]['a'], Decimal('100.0'))
 
     def test_null(self):
@@ -1169,36 +1169,36 @@ class RangeTestCase(unittest.TestCase):
         from psycopg2cffi.extras import Range
         r = Range()
 
-        self.assert_(not r.isempty)
+        self.assertTrue(not r.isempty)
         self.assertEqual(r.lower, None)
         self.assertEqual(r.upper, None)
-        self.assert_(r.lower_inf)
-        self.assert_(r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(r.lower_inf)
+        self.assertTrue(r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_empty(self):
         from psycopg2cffi.extras import Range
         r = Range(empty=True)
 
-        self.assert_(r.isempty)
+        self.assertTrue(r.isempty)
         self.assertEqual(r.lower, None)
         self.assertEqual(r.upper, None)
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_nobounds(self):
         from psycopg2cffi.extras import Range
         r = Range(10, 20)
         self.assertEqual(r.lower, 10)
         self.assertEqual(r.upper, 20)
-        self.assert_(not r.isempty)
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.isempty)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_bounds(self):
         from psycopg2cffi.extras import Range
@@ -1210,9 +1210,9 @@ class RangeTestCase(unittest.TestCase):
             r = Range(10, 20, bounds)
             self.assertEqual(r.lower, 10)
             self.assertEqual(r.upper, 20)
-            self.assert_(not r.isempty)
-            self.assert_(not r.lower_inf)
-            self.assert_(not r.upper_inf)
+            self.assertTrue(not r.isempty)
+            self.assertTrue(not r.lower_inf)
+            self.assertTrue(not r.upper_inf)
             self.assertEqual(r.lower_inc, lower_inc)
             self.assertEqual(r.upper_inc, upper_inc)
 
@@ -1221,20 +1221,20 @@ class RangeTestCase(unittest.TestCase):
         r = Range(upper=20)
         self.assertEqual(r.lower, None)
         self.assertEqual(r.upper, 20)
-        self.assert_(not r.isempty)
-        self.assert_(r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.isempty)
+        self.assertTrue(r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
         r = Range(lower=10, bounds='(]')
         self.assertEqual(r.lower, 10)
         self.assertEqual(r.upper, None)
-        self.assert_(not r.isempty)
-        self.assert_(not r.lower_inf)
-        self.assert_(r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.isempty)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_bad_bounds(self):
         from psycopg2cffi.extras import Range
@@ -1244,66 +1244,66 @@ class RangeTestCase(unittest.TestCase):
     def test_in(self):
         from psycopg2cffi.extras import Range
         r = Range(empty=True)
-        self.assert_(10 not in r)
+        self.assertTrue(10 not in r)
 
         r = Range()
-        self.assert_(10 in r)
+        self.assertTrue(10 in r)
 
         r = Range(lower=10, bounds='[)')
-        self.assert_(9 not in r)
-        self.assert_(10 in r)
-        self.assert_(11 in r)
+        self.assertTrue(9 not in r)
+        self.assertTrue(10 in r)
+        self.assertTrue(11 in r)
 
         r = Range(lower=10, bounds='()')
-        self.assert_(9 not in r)
-        self.assert_(10 not in r)
-        self.assert_(11 in r)
+        self.assertTrue(9 not in r)
+        self.assertTrue(10 not in r)
+        self.assertTrue(11 in r)
 
         r = Range(upper=20, bounds='()')
-        self.assert_(19 in r)
-        self.assert_(20 not in r)
-        self.assert_(21 not in r)
+        self.assertTrue(19 in r)
+        self.assertTrue(20 not in r)
+        self.assertTrue(21 not in r)
 
         r = Range(upper=20, bounds='(]')
-        self.assert_(19 in r)
-        self.assert_(20 in r)
-        self.assert_(21 not in r)
+        self.assertTrue(19 in r)
+        self.assertTrue(20 in r)
+        self.assertTrue(21 not in r)
 
         r = Range(10, 20)
-        self.assert_(9 not in r)
-        self.assert_(10 in r)
-        self.assert_(11 in r)
-        self.assert_(19 in r)
-        self.assert_(20 not in r)
-        self.assert_(21 not in r)
+        self.assertTrue(9 not in r)
+        self.assertTrue(10 in r)
+        self.assertTrue(11 in r)
+        self.assertTrue(19 in r)
+        self.assertTrue(20 not in r)
+        self.assertTrue(21 not in r)
 
         r = Range(10, 20, '(]')
-        self.assert_(9 not in r)
-        self.assert_(10 not in r)
-        self.assert_(11 in r)
-        self.assert_(19 in r)
-        self.assert_(20 in r)
-        self.assert_(21 not in r)
+        self.assertTrue(9 not in r)
+        self.assertTrue(10 not in r)
+        self.assertTrue(11 in r)
+        self.assertTrue(19 in r)
+        self.assertTrue(20 in r)
+        self.assertTrue(21 not in r)
 
         r = Range(20, 10)
-        self.assert_(9 not in r)
-        self.assert_(10 not in r)
-        self.assert_(11 not in r)
-        self.assert_(19 not in r)
-        self.assert_(20 not in r)
-        self.assert_(21 not in r)
+        self.assertTrue(9 not in r)
+        self.assertTrue(10 not in r)
+        self.assertTrue(11 not in r)
+        self.assertTrue(19 not in r)
+        self.assertTrue(20 not in r)
+        self.assertTrue(21 not in r)
 
     def test_nonzero(self):
         from psycopg2cffi.extras import Range
-        self.assert_(Range())
-        self.assert_(Range(10, 20))
-        self.assert_(not Range(empty=True))
+        self.assertTrue(Range())
+        self.assertTrue(Range(10, 20))
+        self.assertTrue(not Range(empty=True))
 
     def test_eq_hash(self):
         from psycopg2cffi.extras import Range
         def assert_equal(r1, r2):
-            self.assert_(r1 == r2)
-            self.assert_(hash(r1) == hash(r2))
+            self.assertTrue(r1 == r2)
+            self.assertTrue(hash(r1) == hash(r2))
 
         assert_equal(Range(empty=True), Range(empty=True))
         assert_equal(Range(), Range())
@@ -1313,8 +1313,8 @@ class RangeTestCase(unittest.TestCase):
         assert_equal(Range(10, 20, '[]'), Range(10, 20, '[]'))
 
         def assert_not_equal(r1, r2):
-            self.assert_(r1 != r2)
-            self.assert_(hash(r1) != hash(r2))
+            self.assertTrue(r1 != r2)
+            self.assertTrue(hash(r1) != hash(r2))
 
         assert_not_equal(Range(10, 20), Range(10, 21))
         assert_not_equal(Range(10, 20), Range(11, 20))
@@ -1359,8 +1359,8 @@ class RangeCasterTestCase(ConnectingTestCase):
         for type in self.builtin_ranges:
             cur.execute("select 'empty'::%s" % type)
             r = cur.fetchone()[0]
-            self.assert_(isinstance(r, Range), type)
-            self.assert_(r.isempty)
+            self.assertTrue(isinstance(r, Range), type)
+            self.assertTrue(r.isempty)
 
     def test_cast_inf(self):
         from psycopg2cffi.extras import Range
@@ -1368,10 +1368,10 @@ class RangeCasterTestCase(ConnectingTestCase):
         for type in self.builtin_ranges:
             cur.execute("select '(,)'::%s" % type)
             r = cur.fetchone()[0]
-            self.assert_(isinstance(r, Range), type)
-            self.assert_(not r.isempty)
-            self.assert_(r.lower_inf)
-            self.assert_(r.upper_inf)
+            self.assertTrue(isinstance(r, Range), type)
+            self.assertTrue(not r.isempty)
+            self.assertTrue(r.lower_inf)
+            self.assertTrue(r.upper_inf)
 
     def test_cast_numbers(self):
         from psycopg2cffi.extras import NumericRange
@@ -1379,39 +1379,39 @@ class RangeCasterTestCase(ConnectingTestCase):
         for type in ('int4range', 'int8range'):
             cur.execute("select '(10,20)'::%s" % type)
             r = cur.fetchone()[0]
-            self.assert_(isinstance(r, NumericRange))
-            self.assert_(not r.isempty)
+            self.assertTrue(isinstance(r, NumericRange))
+            self.assertTrue(not r.isempty)
             self.assertEqual(r.lower, 11)
             self.assertEqual(r.upper, 20)
-            self.assert_(not r.lower_inf)
-            self.assert_(not r.upper_inf)
-            self.assert_(r.lower_inc)
-            self.assert_(not r.upper_inc)
+            self.assertTrue(not r.lower_inf)
+            self.assertTrue(not r.upper_inf)
+            self.assertTrue(r.lower_inc)
+            self.assertTrue(not r.upper_inc)
 
         cur.execute("select '(10.2,20.6)'::numrange")
         r = cur.fetchone()[0]
-        self.assert_(isinstance(r, NumericRange))
-        self.assert_(not r.isempty)
+        self.assertTrue(isinstance(r, NumericRange))
+        self.assertTrue(not r.isempty)
         self.assertEqual(r.lower, Decimal('10.2'))
         self.assertEqual(r.upper, Decimal('20.6'))
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_cast_date(self):
         from psycopg2cffi.extras import DateRange
         cur = self.conn.cursor()
         cur.execute("select '(2000-01-01,2012-12-31)'::daterange")
         r = cur.fetchone()[0]
-        self.assert_(isinstance(r, DateRange))
-        self.assert_(not r.isempty)
+        self.assertTrue(isinstance(r, DateRange))
+        self.assertTrue(not r.isempty)
         self.assertEqual(r.lower, date(2000,1,2))
         self.assertEqual(r.upper, date(2012,12,31))
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_cast_timestamp(self):
         from psycopg2cffi.extras import DateTimeRange
@@ -1420,14 +1420,14 @@ class RangeCasterTestCase(ConnectingTestCase):
         ts2 = datetime(2000,12,31,23,59,59,999)
         cur.execute("select tsrange(%s, %s, '()')", (ts1, ts2))
         r = cur.fetchone()[0]
-        self.assert_(isinstance(r, DateTimeRange))
-        self.assert_(not r.isempty)
+        self.assertTrue(isinstance(r, DateTimeRange))
+        self.assertTrue(not r.isempty)
         self.assertEqual(r.lower, ts1)
         self.assertEqual(r.upper, ts2)
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(not r.lower_inc)
-        self.assert_(not r.upper_inc)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(not r.lower_inc)
+        self.assertTrue(not r.upper_inc)
 
     def test_cast_timestamptz(self):
         from psycopg2cffi.extras import DateTimeTZRange
@@ -1437,14 +1437,14 @@ class RangeCasterTestCase(ConnectingTestCase):
         ts2 = datetime(2000,12,31,23,59,59,999, tzinfo=FixedOffsetTimezone(600))
         cur.execute("select tstzrange(%s, %s, '[]')", (ts1, ts2))
         r = cur.fetchone()[0]
-        self.assert_(isinstance(r, DateTimeTZRange))
-        self.assert_(not r.isempty)
+        self.assertTrue(isinstance(r, DateTimeTZRange))
+        self.assertTrue(not r.isempty)
         self.assertEqual(r.lower, ts1)
         self.assertEqual(r.upper, ts2)
-        self.assert_(not r.lower_inf)
-        self.assert_(not r.upper_inf)
-        self.assert_(r.lower_inc)
-        self.assert_(r.upper_inc)
+        self.assertTrue(not r.lower_inf)
+        self.assertTrue(not r.upper_inf)
+        self.assertTrue(r.lower_inc)
+        self.assertTrue(r.upper_inc)
 
     def test_adapt_number_range(self):
         from psycopg2cffi.extras import NumericRange
@@ -1453,26 +1453,26 @@ class RangeCasterTestCase(ConnectingTestCase):
         r = NumericRange(empty=True)
         cur.execute("select %s::int4range", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange))
-        self.assert_(r1.isempty)
+        self.assertTrue(isinstance(r1, NumericRange))
+        self.assertTrue(r1.isempty)
 
         r = NumericRange(10, 20)
         cur.execute("select %s::int8range", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange))
+        self.assertTrue(isinstance(r1, NumericRange))
         self.assertEqual(r1.lower, 10)
         self.assertEqual(r1.upper, 20)
-        self.assert_(r1.lower_inc)
-        self.assert_(not r1.upper_inc)
+        self.assertTrue(r1.lower_inc)
+        self.assertTrue(not r1.upper_inc)
 
         r = NumericRange(Decimal('10.2'), Decimal('20.5'), '(]')
         cur.execute("select %s::numrange", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange))
+        self.assertTrue(isinstance(r1, NumericRange))
         self.assertEqual(r1.lower, Decimal('10.2'))
         self.assertEqual(r1.upper, Decimal('20.5'))
-        self.assert_(not r1.lower_inc)
-        self.assert_(r1.upper_inc)
+        self.assertTrue(not r1.lower_inc)
+        self.assertTrue(r1.upper_inc)
 
     def test_adapt_numeric_range(self):
         from psycopg2cffi.extras import NumericRange
@@ -1481,26 +1481,26 @@ class RangeCasterTestCase(ConnectingTestCase):
         r = NumericRange(empty=True)
         cur.execute("select %s::int4range", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange), r1)
-        self.assert_(r1.isempty)
+        self.assertTrue(isinstance(r1, NumericRange), r1)
+        self.assertTrue(r1.isempty)
 
         r = NumericRange(10, 20)
         cur.execute("select %s::int8range", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange))
+        self.assertTrue(isinstance(r1, NumericRange))
         self.assertEqual(r1.lower, 10)
         self.assertEqual(r1.upper, 20)
-        self.assert_(r1.lower_inc)
-        self.assert_(not r1.upper_inc)
+        self.assertTrue(r1.lower_inc)
+        self.assertTrue(not r1.upper_inc)
 
         r = NumericRange(Decimal('10.2'), Decimal('20.5'), '(]')
         cur.execute("select %s::numrange", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, NumericRange))
+        self.assertTrue(isinstance(r1, NumericRange))
         self.assertEqual(r1.lower, Decimal('10.2'))
         self.assertEqual(r1.upper, Decimal('20.5'))
-        self.assert_(not r1.lower_inc)
-        self.assert_(r1.upper_inc)
+        self.assertTrue(not r1.lower_inc)
+        self.assertTrue(r1.upper_inc)
 
     def test_adapt_date_range(self):
         from psycopg2cffi.extras import DateRange, DateTimeRange, DateTimeTZRange
@@ -1512,46 +1512,46 @@ class RangeCasterTestCase(ConnectingTestCase):
         r = DateRange(d1, d2)
         cur.execute("select %s", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, DateRange))
+        self.assertTrue(isinstance(r1, DateRange))
         self.assertEqual(r1.lower, d1)
         self.assertEqual(r1.upper, d2)
-        self.assert_(r1.lower_inc)
-        self.assert_(not r1.upper_inc)
+        self.assertTrue(r1.lower_inc)
+        self.assertTrue(not r1.upper_inc)
 
         r = DateRange('2012-01-01', '2012-12-31')
         cur.execute("select %s", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, DateRange))
+        self.assertTrue(isinstance(r1, DateRange))
         self.assertEqual(r1.lower, d1)
         self.assertEqual(r1.upper, d2)
-        self.assert_(r1.lower_inc)
-        self.assert_(not r1.upper_inc)
+        self.assertTrue(r1.lower_inc)
+        self.assertTrue(not r1.upper_inc)
 
         r = DateRange(_u(b'2012-01-01'), _u(b'2012-12-31'))
         cur.execute("select %s", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, DateRange))
+        self.assertTrue(isinstance(r1, DateRange))
         self.assertEqual(r1.lower, d1)
         self.assertEqual(r1.upper, d2)
-        self.assert_(r1.lower_inc)
-        self.assert_(not r1.upper_inc)
+        self.assertTrue(r1.lower_inc)
+        self.assertTrue(not r1.upper_inc)
 
         r = DateTimeRange(empty=True)
         cur.execute("select %s", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, DateTimeRange))
-        self.assert_(r1.isempty)
+        self.assertTrue(isinstance(r1, DateTimeRange))
+        self.assertTrue(r1.isempty)
 
         ts1 = datetime(2000,1,1, tzinfo=FixedOffsetTimezone(600))
         ts2 = datetime(2000,12,31,23,59,59,999, tzinfo=FixedOffsetTimezone(600))
         r = DateTimeTZRange(ts1, ts2, '(]')
         cur.execute("select %s", (r,))
         r1 = cur.fetchone()[0]
-        self.assert_(isinstance(r1, DateTimeTZRange))
+        self.assertTrue(isinstance(r1, DateTimeTZRange))
         self.assertEqual(r1.lower, ts1)
         self.assertEqual(r1.upper, ts2)
-        self.assert_(not r1.lower_inc)
-        self.assert_(r1.upper_inc)
+        self.assertTrue(not r1.lower_inc)
+        self.assertTrue(r1.upper_inc)
 
     def test_register_range_adapter(self):
         from psycopg2cffi.extras import Range, register_range
@@ -1560,7 +1560,7 @@ class RangeCasterTestCase(ConnectingTestCase):
         rc = register_range('textrange', 'TextRange', cur)
 
         TextRange = rc.range
-        self.assert_(issubclass(TextRange, Range))
+        self.assertTrue(issubclass(TextRange, Range))
         self.assertEqual(TextRange.__name__, 'TextRange')
 
         r = TextRange('a', 'b', '(]')
@@ -1568,8 +1568,8 @@ class RangeCasterTestCase(ConnectingTestCase):
         r1 = cur.fetchone()[0]
         self.assertEqual(r1.lower, 'a')
         self.assertEqual(r1.upper, 'b')
-        self.assert_(not r1.lower_inc)
-        self.assert_(r1.upper_inc)
+        self.assertTrue(not r1.lower_inc)
+        self.assertTrue(r1.upper_inc)
 
         cur.execute("select %s", ([r,r,r],))
         rs = cur.fetchone()[0]
@@ -1577,8 +1577,8 @@ class RangeCasterTestCase(ConnectingTestCase):
         for r1 in rs:
             self.assertEqual(r1.lower, 'a')
             self.assertEqual(r1.upper, 'b')
-            self.assert_(not r1.lower_inc)
-            self.assert_(r1.upper_inc)
+            self.assertTrue(not r1.lower_inc)
+            self.assertTrue(r1.upper_inc)
 
     def test_range_escaping(self):
         from psycopg2cffi.extras import register_range
@@ -1619,7 +1619,7 @@ class RangeCasterTestCase(ConnectingTestCase):
 
         # ...not too many errors! in the above collate there are 17 errors:
         # assume in other collates we won't find more than 30
-        self.assert_(errs < 30,
+        self.assertTrue(errs < 30,
             "too many collate errors. Is the test working?")
 
         cur.execute("select id, range from rangetest order by id")
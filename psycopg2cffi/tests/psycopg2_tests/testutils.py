@@ -22,97 +22,127 @@
 # License for more details.
 
 
-# Use unittest2 if available. Otherwise mock a skip facility with warnings.
+import atexit
 import operator
-import os
 import re
 import sys
 import types
+import unittest
 
-import six
+from collections import namedtuple
 from functools import wraps
+from psycopg2cffi.compat import lru_cache
 from psycopg2cffi.tests.psycopg2_tests.testconfig import dsn
 
-try:
-    import unittest2
-    unittest = unittest2
-except ImportError:
-    import unittest
-    unittest2 = None
-
-if hasattr(unittest, 'skipIf'):
-    skip = unittest.skip
-    skipIf = unittest.skipIf
-
-else:
-    import warnings
-
-    def skipIf(cond, msg):
-        def skipIf_(f):
-            @wraps(f)
-            def skipIf__(self):
-                if cond:
-                    warnings.warn(msg)
-                    return
-                else:
-                    return f(self)
-            return skipIf__
-        return skipIf_
-
-    def skip(msg):
-        return skipIf(True, msg)
-
-    def skipTest(self, msg):
-        warnings.warn(msg)
-        return
-
-    unittest.TestCase.skipTest = skipTest
-
-# Silence warnings caused by the stubborness of the Python unittest maintainers
-# http://bugs.python.org/issue9424
-if not hasattr(unittest.TestCase, 'assert_') \
-or unittest.TestCase.assert_ is not unittest.TestCase.assertTrue:
-    # mavaff...
-    unittest.TestCase.assert_ = unittest.TestCase.assertTrue
-    unittest.TestCase.failUnless = unittest.TestCase.assertTrue
-    unittest.TestCase.assertEquals = unittest.TestCase.assertEqual
-    unittest.TestCase.failUnlessEqual = unittest.TestCase.assertEqual
+unittest2 = None
+skip = unittest.skip
+skipIf = unittest.skipIf
+
+
+_E_SUB_TEXT = re.compile(r"\bE'")
+_E_SUB_BYTES = re.compile(br"\bE'")
 
 
 class ConnectingTestCase(unittest.TestCase):
     """A test case providing connections for tests.
 
     A connection for the test is always available as `self.conn`. Others can be
-    created with `self.connect()`. All are closed on tearDown.
+    created with `self.connect()`: they are taken from a connection pool and
+    are given back to it (or closed) on tearDown.
 
-    Subclasses needing to customize setUp and tearDown should remember to call
-    the base class implementations.
+    `self.conn` is shared by all the tests of the class: it is opened on first
+    use and, after each test, reset to a pristine session (or closed, if the
+    test left it in a state that can't be restored). Assign to `self.conn` to
+    use a different connection in a single test.
+
+    Subclasses needing to customize tearDown should remember to call the base
+    class implementation.
     """
-    def setUp(self):
+    _class_conn = None
+    _class_conn_state = None
+
+    @classmethod
+    def setUpClass(cls):
+        super(ConnectingTestCase, cls).setUpClass()
+        cls._class_conn = None
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._class_conn is not None and not cls._class_conn.closed:
+            cls._class_conn.close()
+        cls._class_conn = None
+        super(ConnectingTestCase, cls).tearDownClass()
+
+    def __init__(self, *args, **kwargs):
+        super(ConnectingTestCase, self).__init__(*args, **kwargs)
         self._conns = []
+        self._the_conn = None
 
     def tearDown(self):
-        # close the connections used in the test
-        for conn in self._conns:
-            if not conn.closed:
-                conn.close()
+        # give back or close the connections used in the test
+        for pool, conn, state in self._conns:
+            if pool is None:
+                if not conn.closed:
+                    conn.close()
+            else:
+                pool.putconn(conn, close=not _reset_conn(conn, state))
+        del self._conns[:]
+
+        # make the shared connection ready for the next test
+        cls = self.__class__
+        if cls._class_conn is not None \
+                and not _reset_conn(cls._class_conn, cls._class_conn_state):
+            cls._class_conn.close()
+            cls._class_conn = None
+
+        self._the_conn = None
+
+    def connect(self, pooled=True, **kwargs):
+        """Return a connection to the test database.
+
+        The connection is taken from a pool shared by the tests opening
+        connections with the same *kwargs*. Pass *pooled* = False to get a
+        brand new connection instead. Asynchronous connections are never
+        pooled.
+
+        The pool key doesn't account for the libpq environment variables
+        (PGCLIENTENCODING and the like): a test setting them must
+        use an unpooled connection. So should a test passing a
+        *connection_factory* defined in its body, which is a new pool key on
+        every run.
+        """
+        import psycopg2cffi as psycopg2
+        from psycopg2cffi.pool import PoolError
 
-    def connect(self, **kwargs):
-        try:
-            self._conns
-        except AttributeError as e:
-            raise AttributeError(
-                "%s (did you remember calling ConnectingTestCase.setUp()?)"
-                % e)
+        pool = None
+        if pooled and not (kwargs.get('async') or kwargs.get('async_')):
+            pool = _get_pool(kwargs)
 
-        import psycopg2cffi as psycopg2
-        conn = psycopg2.connect(dsn, **kwargs)
-        self._conns.append(conn)
+        if pool is not None:
+            try:
+                conn = pool.getconn()
+            except PoolError:
+                # too many connections in use: don't wait for one
+                pool = None
+
+        if pool is None:
+            conn = psycopg2.connect(dsn, **kwargs)
+
+        self._conns.append((pool, conn, _conn_state(conn)))
         return conn
 
     def _get_conn(self):
-        if not hasattr(self, '_the_conn'):
-            self._the_conn = self.connect()
+        if self._the_conn is None:
+            # Reopen the shared connection if a previous test closed it
+            # without going through our tearDown. Keep returning the same
+            # object during this test though, even if the test closes it.
+            cls = self.__class__
+            if cls._class_conn is None or cls._class_conn.closed:
+                import psycopg2cffi as psycopg2
+                cls._class_conn = psycopg2.connect(dsn)
+                cls._class_conn_state = _conn_state(cls._class_conn)
+
+            self._the_conn = cls._class_conn
 
         return self._the_conn
 
@@ -123,17 +153,91 @@ class ConnectingTestCase(unittest.TestCase):
 
     def assertQuotedEqual(self, first, second, msg=None):
         """Compare two quoted strings disregarding eventual E'' quotes"""
+        if isinstance(first, str):
+            kind, rex, repl = str, _E_SUB_TEXT, "'"
+        elif isinstance(first, bytes):
+            kind, rex, repl = bytes, _E_SUB_BYTES, b"'"
+        else:
+            return self.assertEqual(first, second, msg)
+
         def f(s):
-            if isinstance(s, six.text_type):
-                return re.sub(r"\bE'", "'", s)
-            elif isinstance(first, bytes):
-                return re.sub(br"\bE'", b"'", s)
+            if isinstance(s, kind):
+                return rex.sub(repl, s)
             else:
                 return s
 
         return self.assertEqual(f(first), f(second), msg)
 
 
+# Connection pools used by ConnectingTestCase.connect(), by connect() kwargs
+_pools = {}
+
+
+def _get_pool(kwargs):
+    """Return the pool of connections opened with *kwargs*.
+
+    Return None if the kwargs can't be used as a pool key.
+    """
+    try:
+        key = frozenset(kwargs.items())
+        pool = _pools.get(key)
+    except TypeError:
+        return None
+
+    if pool is None:
+        from psycopg2cffi.pool import ThreadedConnectionPool
+        pool = _pools[key] = ThreadedConnectionPool(1, 8, dsn, **kwargs)
+    return pool
+
+
+def _close_pools():
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
+
+
+atexit.register(_close_pools)
+
+
+def _conn_state(conn):
+    """Return the client-side state of *conn* that a reset can't restore."""
+    return (conn.encoding, conn.cursor_factory)
+
+
+def _reset_conn(conn, state):
+    """Bring *conn* back to a pristine session so that it can be reused.
+
+    *state* is the `_conn_state()` of the connection when it was opened.
+    Return False if the connection is closed, broken or was changed by the
+    test in a way that can't be undone: it should be discarded then.
+    """
+    from psycopg2cffi import Error
+
+    if conn.closed or conn.async_ or _conn_state(conn) != state \
+            or conn._typecasts or not isinstance(conn.notices, list):
+        return False
+
+    try:
+        # abort any transaction (tpc included) and reset the session
+        # characteristics, then drop temp tables, prepared statements
+        # and LISTEN registrations left behind by the test.
+        conn.reset()
+        conn.autocommit = True
+        cur = conn.cursor()
+        cur.execute("DISCARD ALL")
+        # the reset brings back the server DateStyle: force ISO again as
+        # the connection does when it's opened.
+        if not conn._iso_compatible_datestyle():
+            cur.execute("SET DATESTYLE TO 'ISO'")
+        conn.autocommit = False
+    except Error:
+        return False
+
+    del conn.notices[:]
+    del conn.notifies[:]
+    return True
+
+
 def decorate_all_tests(obj, *decorators):
     """
     Apply all the *decorators* to all the tests defined in the TestCase *obj*.
@@ -151,10 +255,49 @@ def decorate_all_tests(obj, *decorators):
 
         return decorator
 
-    for n in dir(obj):
-        if n.startswith('test'):
-            for d in decorators:
-                setattr(obj, n, d(getattr(obj, n)))
+    # Look up the tests in the classes' __dict__ rather than with dir() and
+    # getattr(): it skips the non-test attributes of TestCase and doesn't go
+    # through the descriptors. Walk the mro to also decorate inherited tests.
+    seen = set()
+    for cls in obj.__mro__:
+        for n, v in list(vars(cls).items()):
+            if not n.startswith('test') or n in seen:
+                continue
+            seen.add(n)
+            if callable(v):
+                for d in decorators:
+                    v = d(v)
+                setattr(obj, n, v)
+
+
+_ServerCaps = namedtuple('_ServerCaps',
+    'server_version has_uuid max_prepared_transactions')
+
+
+@lru_cache(maxsize=16)
+def _server_caps(dsn):
+    """Return the features of the server at *dsn* the skip decorators check.
+
+    The server is probed with a single query on a connection of its own the
+    first time: the result doesn't change during the test run.
+    max_prepared_transactions is None if the server doesn't support two
+    phase commit.
+    """
+    import psycopg2cffi as psycopg2
+    cnn = psycopg2.connect(dsn)
+    try:
+        cur = cnn.cursor()
+        cur.execute("""
+            select
+                exists (select 1 from pg_type where typname = 'uuid'),
+                (select setting from pg_settings
+                    where name = 'max_prepared_transactions')
+            """)
+        has_uuid, mtp = cur.fetchone()
+        return _ServerCaps(cnn.server_version, has_uuid,
+            int(mtp) if mtp is not None else None)
+    finally:
+        cnn.close()
 
 
 def skip_if_no_uuid(f):
@@ -166,14 +309,7 @@ def skip_if_no_uuid(f):
         except ImportError:
             return self.skipTest("uuid not available in this Python version")
 
-        try:
-            cur = self.conn.cursor()
-            cur.execute("select typname from pg_type where typname = 'uuid'")
-            has = cur.fetchone()
-        finally:
-            self.conn.rollback()
-
-        if has:
+        if _server_caps(dsn).has_uuid:
             return f(self)
         else:
             return self.skipTest("uuid type not available on the server")
@@ -185,17 +321,10 @@ def skip_if_tpc_disabled(f):
     """Skip a test if the server has tpc support disabled."""
     @wraps(f)
     def skip_if_tpc_disabled_(self):
-        from psycopg2cffi import ProgrammingError
-        cnn = self.connect()
-        cur = cnn.cursor()
-        try:
-            cur.execute("SHOW max_prepared_transactions;")
-        except ProgrammingError:
+        mtp = _server_caps(dsn).max_prepared_transactions
+        if mtp is None:
             return self.skipTest(
                 "server too old: two phase transactions not supported.")
-        else:
-            mtp = int(cur.fetchone()[0])
-        cnn.close()
 
         if not mtp:
             return self.skipTest(
@@ -236,13 +365,15 @@ def skip_if_no_iobase(f):
 def skip_before_postgres(*ver):
     """Skip a test on PostgreSQL before a certain version."""
     ver = ver + (0,) * (3 - len(ver))
+    ver = int("%d%02d%02d" % ver)
 
     def skip_before_postgres_(f):
         @wraps(f)
         def skip_before_postgres__(self):
-            if self.conn.server_version < int("%d%02d%02d" % ver):
+            server_version = _server_caps(dsn).server_version
+            if server_version < ver:
                 return self.skipTest("skipped because PostgreSQL %s"
-                    % self.conn.server_version)
+                    % server_version)
             else:
                 return f(self)
 
@@ -253,13 +384,15 @@ def skip_before_postgres(*ver):
 def skip_after_postgres(*ver):
     """Skip a test on PostgreSQL after (including) a certain version."""
     ver = ver + (0,) * (3 - len(ver))
+    ver = int("%d%02d%02d" % ver)
 
     def skip_after_postgres_(f):
         @wraps(f)
         def skip_after_postgres__(self):
-            if self.conn.server_version >= int("%d%02d%02d" % ver):
+            server_version = _server_caps(dsn).server_version
+            if server_version >= ver:
                 return self.skipTest("skipped because PostgreSQL %s"
-                    % self.conn.server_version)
+                    % server_version)
             else:
                 return f(self)
 
@@ -341,19 +474,13 @@ def skip_if_no_getrefcount(f):
     return skip_if_no_getrefcount_
 
 
-def crdb_version(conn, __crdb_version=None):
+def crdb_version(conn):
     """
     Return the CockroachDB version if that's the db being tested, else None.
     Return the number as an integer similar to PQserverVersion: return
     v20.1.3 as 200103.
-    Assume all the connections are on the same db: return a cached result on
-    following calls.
+    The version string reported by the server is only parsed once.
     """
-    __crdb_version = __crdb_version or list()
-
-    if __crdb_version:
-        return __crdb_version[0]
-
     # Wrapped with try/except to avoid AttributeError as 'Connection' object has no attribute 'info'.
     # Should it be ibe implemented?
     try:
@@ -361,18 +488,23 @@ def crdb_version(conn, __crdb_version=None):
     except AttributeError:
         sver = None
 
+    return _parse_crdb_version(sver)
+
+
+_CRDB_VER_RE = re.compile(r"\bv(\d+)\.(\d+)\.(\d+)")
+
+
+@lru_cache(maxsize=16)
+def _parse_crdb_version(sver):
     if sver is None:
-        __crdb_version.append(None)
-    else:
-        m = re.search(r"\bv(\d+)\.(\d+)\.(\d+)", sver)
-        if not m:
-            raise ValueError(
-                "can't parse CockroachDB version from %s" % sver)
+        return None
 
-        ver = int(m.group(1)) * 10000 + int(m.group(2)) * 100 + int(m.group(3))
-        __crdb_version.append(ver)
+    m = _CRDB_VER_RE.search(sver)
+    if not m:
+        raise ValueError(
+            "can't parse CockroachDB version from %s" % sver)
 
-    return __crdb_version[0]
+    return int(m.group(1)) * 10000 + int(m.group(2)) * 100 + int(m.group(3))
 
 
 def skip_if_crdb(reason, conn=None, version=None):
@@ -385,7 +517,7 @@ def skip_if_crdb(reason, conn=None, version=None):
     If *version* is specified it should be a string such as ">= 20.1", "< 20",
     "== 20.1.3": the test will be skipped only if the version matches.
     """
-    if not isinstance(reason, six.string_types):
+    if not isinstance(reason, str):
         raise TypeError("reason should be a string, got %r instead" % reason)
 
     if conn is not None:
@@ -432,11 +564,16 @@ crdb_reasons = {
 }
 
 
+_CRDB_OP_RE = re.compile(
+    r'^(>|>=|<|<=|==|!=)\s*(\d+)(?:\.(\d+))?(?:\.(\d+))?$')
+
+
+@lru_cache(maxsize=256)
 def _crdb_match_version(version, pattern):
     if pattern is None:
         return True
 
-    m = re.match(r'^(>|>=|<|<=|==|!=)\s*(\d+)(?:\.(\d+))?(?:\.(\d+))?$', pattern)
+    m = _CRDB_OP_RE.match(pattern)
     if m is None:
         raise ValueError(
             "bad crdb version pattern %r: should be 'OP MAJOR[.MINOR[.BUGFIX]]'"
@@ -449,33 +586,10 @@ def _crdb_match_version(version, pattern):
 
 
 def script_to_py3(script):
-    """Convert a script to Python3 syntax if required."""
-    if sys.version_info[0] < 3:
-        return script
-
-    import tempfile
-    f = tempfile.NamedTemporaryFile(suffix=".py", delete=False)
-    f.write(script.encode())
-    f.flush()
-    filename = f.name
-    f.close()
-
-    # 2to3 is way too chatty
-    import logging
-    logging.basicConfig(filename=os.devnull)
-
-    from lib2to3.main import main
-    if main("lib2to3.fixes", ['--no-diffs', '-w', '-n', filename]):
-        raise Exception('py3 conversion failed')
-
-    f2 = open(filename)
-    try:
-        return f2.read()
-    finally:
-        f2.close()
-        os.remove(filename)
+    """Return *script* unchanged: scripts must be written in Python 3."""
+    return script
 
 
 def _u(s):
-    assert isinstance(s, six.binary_type)
+    assert isinstance(s, bytes)
     return s.decode('utf-8')
@@ -42,7 +42,6 @@ setup_kwargs = dict(
         'Development Status :: 3 - Alpha',
         'License :: OSI Approved :: GNU Library or Lesser General Public License (LGPL)',
         'Intended Audience :: Developers',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
@@ -59,6 +58,7 @@ setup_kwargs = dict(
     test_suite='psycopg2cffi.tests.suite',
     packages=['psycopg2cffi', 'psycopg2cffi._impl', 'psycopg2cffi.tests'],
     install_requires=['six'],
+    python_requires='>=3.5',
 )
 
 if new_cffi: